@@ -32,14 +32,16 @@ class Abstract_GL_MarketDocument_Parser(Entsoe_Document_Parser):
 
 
 class GL_MarketDocument_Parser(Abstract_GL_MarketDocument_Parser):
-    def __init__(self):
+    def __init__(self, max_workers: int = None):
         super(GL_MarketDocument_Parser, self).__init__()
         self.set_Series_Period_Parser(utils.StandardPeriodParser)
         self.set_TimeSeries_Parser(
             utils.Tree_to_DataFrame(self.Series_Period_Parser, "Period")
         )
         self.set_Document_Parser(
-            utils.Tree_to_DataFrame(self.TimeSeries_Parser, "TimeSeries")
+            utils.Tree_to_DataFrame(
+                self.TimeSeries_Parser, "TimeSeries", max_workers=max_workers, metadata_as_category=True
+            )
         )
 
     def parse(self):
@@ -1,6 +1,5 @@
 from entsoe_client.Parsers import ParserUtils as utils
 from entsoe_client.Parsers.Entsoe_Document_Parser import Entsoe_Document_Parser
-import pandas as pd
 
 
 class Abstract_Outages_MarketDocument_Parser(Entsoe_Document_Parser):
@@ -41,7 +40,9 @@ class Outages_MarketDocument_Parser(Abstract_Outages_MarketDocument_Parser):
 
     def parse(self):
         lst = [self.Document_Parser(elem) for elem in self.objectified_input_xml]
-        df = pd.concat(lst)
+        df = utils.concat_frames(lst)
+        # Everything but the `Point` fields is per-document metadata.
+        df = utils.categorize_metadata(df, df.columns.difference(['position', 'quantity']))
         return df
 
 
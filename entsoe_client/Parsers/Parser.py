@@ -19,27 +19,39 @@ from entsoe_client.Parsers.Acknowledgment_MarketDocument_Parser import \
     Acknowledgment_MarketDocument_Parser
 from entsoe_client.Parsers.Outages_MarketDocument_Parser import \
     Outages_MarketDocument_Parser
+from entsoe_client.Parsers.ParserUtils import localname
 
 
 class Parser:
+    def __init__(self, max_workers: int = None):
+        """
+        `max_workers` parses the TimeSeries of large documents in a process pool; `None` parses sequentially.
+        Where worker processes are spawned rather than forked (macOS, Windows), the calling script
+        must guard its entry point with `if __name__ == "__main__":`.
+        """
+        self.max_workers = max_workers
+
     @staticmethod
-    def parse(response: requests.Response):
+    def parse(response: requests.Response, max_workers: int = None):
         response_type = response.headers["Content-Type"]
         content = response.content
         if (response_type == "text/xml") or (response_type == "application/xml"):
-            parser = XMLParser()
+            parser = XMLParser(max_workers)
         elif response_type == "application/zip":
-            parser = ZipParser()
+            parser = ZipParser(max_workers)
         else:
             raise NotImplementedError
         df = parser.parse(content)
         return df
 
     def __call__(self, response: requests.Response):
-        return self.parse(response)
+        return self.parse(response, self.max_workers)
 
 
 class ZipParser:
+    def __init__(self, max_workers: int = None):
+        self.max_workers = max_workers
+
     @staticmethod
     def unpack_archive(response_content: bytes) -> List[bytes]:
         archive = ZipFile(BytesIO(response_content), "r")
@@ -49,17 +61,21 @@ class ZipParser:
     def parse(self, zip_archive: bytes):
         xml_documents = self.unpack_archive(zip_archive)
         deserailized_xmls = [XMLParser.deserialize_xml(elem) for elem in xml_documents]
-        parser = factory.get_parser(deserailized_xmls[0].tag, deserailized_xmls[0].type.text)
+        parser = factory.get_parser(deserailized_xmls[0].tag, deserailized_xmls[0].type.text, self.max_workers)
         parser.set_objectified_input_xml(deserailized_xmls)
         return parser.parse()
 
 
 class XMLParser:
+    def __init__(self, max_workers: int = None):
+        self.max_workers = max_workers
+
     @staticmethod
     def deserialize_xml(response_content: bytes) -> objectify.ObjectifiedElement:
         objectified_xml = objectify.fromstring(response_content)
-        for elem in objectified_xml.getiterator():
-            elem.tag = etree.QName(elem).localname
+        # Strip namespaces once here, so all later lookups can use plain, namespace-free tags.
+        for elem in objectified_xml.iter(etree.Element):
+            elem.tag = localname(elem.tag)
         etree.cleanup_namespaces(objectified_xml)
         if objectified_xml.find("type") is None:  # happens when a query is not fulfilled
             objectified_xml["type"] = "Query error"
@@ -67,21 +83,21 @@ class XMLParser:
 
     def parse(self, xml_document: bytes):
         object_content = self.deserialize_xml(xml_document)
-        parser = factory.get_parser(object_content.tag, object_content.type.text)
+        parser = factory.get_parser(object_content.tag, object_content.type.text, self.max_workers)
         parser.set_objectified_input_xml(object_content)
         return parser.parse()
 
 
 class ParserFactory:
     @staticmethod
-    def get_parser(tag: str, document_type: str):
+    def get_parser(tag: str, document_type: str, max_workers: int = None):
         if tag in ["Acknowledgement_MarketDocument"]:
             return Acknowledgment_MarketDocument_Parser()
         elif tag in ["Unavailability_MarketDocument"]:
             return Outages_MarketDocument_Parser()
         elif tag in ["GL_MarketDocument"]:
             if document_type in ["A65", "A70"]:  # Load
-                return GL_MarketDocument_Parser()
+                return GL_MarketDocument_Parser(max_workers)
             elif document_type in [
                 "A71",
                 "A72",
@@ -91,12 +107,12 @@ class ParserFactory:
                 "A74",
                 "A75",
             ]:  # Generation
-                return GL_MarketDocument_Parser()
+                return GL_MarketDocument_Parser(max_workers)
             else:
                 raise ValueError(document_type)
         elif tag in ["TransmissionNetwork_MarketDocument"]:
             if document_type in ["A90", "A63", "A91", "A92"]:
-                return TransmissionNetwork_MarketDocument_Parser()
+                return TransmissionNetwork_MarketDocument_Parser(max_workers)
             else:
                 raise ValueError(document_type)
         elif tag in ["Publication_MarketDocument"]:
@@ -111,7 +127,7 @@ class ParserFactory:
                 "A11",
                 "A94",
             ]:
-                return Publication_MarketDocument_Parser()
+                return Publication_MarketDocument_Parser(max_workers)
             else:
                 raise ValueError(document_type)
         elif tag in ["Balancing_MarketDocument"]:
@@ -123,12 +139,12 @@ class ParserFactory:
                 "A88",
                 "A89",
             ]:  # XML Responses
-                return Balancing_MarketDocument_Parser()
+                return Balancing_MarketDocument_Parser(max_workers)
             elif document_type in ["A85", "A86"]:  # Zip Responses
-                return Balancing_MarketDocument_Parser()
+                return Balancing_MarketDocument_Parser(max_workers)
             elif document_type in ["A87"]:  # Special "Point" Type.
                 return (
-                    Balancing_MarketDocument_FinancialExpensesAndIncomeForBalancing_Parser()
+                    Balancing_MarketDocument_FinancialExpensesAndIncomeForBalancing_Parser(max_workers)
                 )
             else:
                 raise ValueError(document_type)
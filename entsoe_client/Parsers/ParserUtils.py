@@ -11,10 +11,47 @@ The root node holds meta-data on the global parameters of the query.
 A minimal, trivial parser would purely unroll such structure recursively.
 """
 import datetime
+import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from typing import Callable, Dict, List, Any
 
+import numpy as np
 import pandas as pd
-from lxml import etree
+from lxml import etree, objectify
+
+# Documents are namespace-free after `XMLParser.deserialize_xml`, so the recurring
+# lookups are compiled once here instead of on every call.
+_XP_CHILDREN = etree.XPath("./*")
+_XP_POINT = etree.XPath("./Point")
+_XP_POINT_COUNT = etree.XPath("count(./Point)")
+_XP_POINT_FIELD_COUNT = etree.XPath("count(./Point/*)")
+_XP_POINT_FIELDS = etree.XPath("./Point/*/text()[1]", smart_strings=False)
+_XP_NONPOINT = etree.XPath("./*[not(self::Point)]")
+
+
+@lru_cache(maxsize=None)
+def _subnode_xpaths(subnode_tag: str) -> tuple[etree.XPath, etree.XPath]:
+    """Compiled (subnodes, metadata nodes) lookups for a given subnode tag."""
+    return (
+        etree.XPath(f"./{subnode_tag}"),
+        etree.XPath(f"./*[not(self::{subnode_tag})]"),
+    )
+
+
+@lru_cache(maxsize=None)
+def _point_layout_xpath(tags: tuple[str, ...]) -> etree.XPath:
+    """Counts the Point fields sitting at their position in `tags`; equals Points x fields only if all match."""
+    return etree.XPath(" + ".join(
+        f"count(./Point/*[{index}][self::{tag}])" for index, tag in enumerate(tags, start=1)
+    ))
+
+
+@lru_cache(maxsize=None)
+def localname(tag: str) -> str:
+    """`{namespace}name` -> `name`; tags without namespace are returned unchanged."""
+    return tag.rpartition("}")[2]
 
 
 def unfold_node(
@@ -24,25 +61,55 @@ def unfold_node(
     Recursive unfolding of a node into a dict.
     TODO: Ensure no overwriting of same dict-names in the unfolding.
     """
-    tag: str = node.tag
-    children: etree._Element = node.getchildren()
-    if not children:
-        return tag, node.text
-    else:
-        return tag, dict([unfold_node(child) for child in children])
+    # `iterchildren` rather than `len(node)`/`iter(node)`, which address siblings on objectified elements.
+    if next(node.iterchildren(), None) is None:
+        return node.tag, node.text
+    return node.tag, dict(map(unfold_node, node.iterchildren()))
+
+
+def _flatten(metadata: dict, prefix: str = "") -> dict:
+    """{'a': {'b': 'c'}} -> {'a.b': 'c'}, mirroring the column names of `pd.json_normalize`."""
+    flat = {}
+    for key, value in metadata.items():
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{prefix}{key}."))
+        else:
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+def assign_metadata(df: pd.DataFrame, meta_dict: dict) -> pd.DataFrame:
+    """Broadcast scalar metadata onto every row of `df`, merged into one `df.assign` call."""
+    if not meta_dict:
+        return df
+    return df.assign(**meta_dict)
+
+
+def concat_frames(dfs: List[pd.DataFrame]) -> pd.DataFrame:
+    """`pd.concat` along the rows; a lone frame needs no concatenation at all."""
+    if len(dfs) == 1:
+        return dfs[0]
+    return pd.concat(dfs, axis=0)
+
+
+def categorize_metadata(df: pd.DataFrame, columns) -> pd.DataFrame:
+    """
+    Store the metadata `columns` as categoricals, so each row holds a small code instead of a repeated string.
+    Applied once to the final document frame; categoricals built per subtree would not survive `pd.concat`.
+    """
+    return df.astype({column: "category" for column in columns})
 
 
 def decompose_node(node: etree._Element, subnode_tag) -> tuple[dict, list]:
     """node -> [subnodes], {metadata}"""
     if not subnode_tag:
-        data_nodes: list = node.xpath(f"./*")
-        data: dict = {node.tag.partition("}")[2]: dict(map(unfold_node, data_nodes))}
+        data_nodes: list = _XP_CHILDREN(node)
+        data: dict = {localname(node.tag): dict(map(unfold_node, data_nodes))}
         return {}, [data]
     if isinstance(subnode_tag, str):
-        subnodes: list = node.findall(f"./{subnode_tag}", node.nsmap)
-        metadata_nodes: list = node.xpath(
-            f"./*[not(self::{subnode_tag})]", namespaces=node.nsmap
-        )
+        subnodes_xpath, metadata_xpath = _subnode_xpaths(subnode_tag)
+        subnodes: list = subnodes_xpath(node)
+        metadata_nodes: list = metadata_xpath(node)
         metadata: dict = {node.tag: dict(map(unfold_node, metadata_nodes))}
         return metadata, subnodes
     if isinstance(subnode_tag, list):
@@ -50,57 +117,107 @@ def decompose_node(node: etree._Element, subnode_tag) -> tuple[dict, list]:
         raise NotImplementedError
 
 
+def _parse_serialized_subtree(subtree_to_dataframe: Callable, serialized_subtree: bytes) -> pd.DataFrame:
+    """Worker entry point: lxml elements do not pickle, so subtrees travel as bytes."""
+    return subtree_to_dataframe(objectify.fromstring(serialized_subtree))
+
+
 class Tree_to_DataFrame:
-    def __init__(self, subtree_to_dataframe: Callable, subtree_tag: str):
+    def __init__(self, subtree_to_dataframe: Callable, subtree_tag: str, max_workers: int = None,
+                 metadata_as_category: bool = False):
+        """
+        `max_workers` opts into parsing subtrees in a process pool. Subtrees are independent, but
+        their parsing is Python-bound and holds the GIL, so threads would not help. The default
+        stays sequential, since spawning workers and re-parsing serialized subtrees only pays off
+        for large documents with many subtrees.
+        `metadata_as_category` is meant for the document level: the metadata columns of all nested
+        levels are converted to categoricals once the document frame is complete.
+        """
         self.subtree_to_dataframe = subtree_to_dataframe
         self.subtree_tag = subtree_tag
+        self.max_workers = max_workers
+        self.metadata_as_category = metadata_as_category
 
     def __call__(self, root):
         metadata, subtree_list = decompose_node(root, self.subtree_tag)
-        meta_dict = pd.json_normalize(metadata).iloc[0].to_dict()
-        subtree_dfs = [self.subtree_to_dataframe(subtree) for subtree in subtree_list]
-        df = pd.concat(subtree_dfs, axis=0)
-        df = df.assign(**meta_dict)
+        meta_dict = _flatten(metadata)
+        if self.max_workers and len(subtree_list) > 1:
+            subtree_dfs = self._parse_parallel(subtree_list)
+        else:
+            subtree_dfs = [self.subtree_to_dataframe(subtree) for subtree in subtree_list]
+        # Concatenate all subtrees in one go; a lone subtree needs no concatenation at all.
+        df = concat_frames(subtree_dfs)
+        df = assign_metadata(df, meta_dict)
+        if self.metadata_as_category:
+            prefixes = tuple(f"{tag}." for tag in self.level_tags(root))
+            df = categorize_metadata(df, [column for column in df.columns if column.startswith(prefixes)])
         return df
 
+    def level_tags(self, root) -> List[str]:
+        """Tags of `root` and of the nested subtree levels; metadata columns are prefixed with them."""
+        tags, parser = [root.tag], self
+        while isinstance(parser, Tree_to_DataFrame):
+            tags.append(parser.subtree_tag)
+            parser = parser.subtree_to_dataframe
+        return tags
+
+    def _parse_parallel(self, subtree_list: List[etree._Element]) -> List[pd.DataFrame]:
+        serialized_subtrees = [etree.tostring(subtree) for subtree in subtree_list]
+        worker_fn = partial(_parse_serialized_subtree, self.subtree_to_dataframe)
+        chunksize = max(1, len(serialized_subtrees) // (self.max_workers * 4))
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(worker_fn, serialized_subtrees, chunksize=chunksize))
+
 
 def Root_to_DataFrame_fn() -> Callable:
     def Root_to_DataFrame(Root: etree._Element) -> pd.DataFrame:
-        data = [(elem.tag, elem.text) for elem in Root.getiterator()]
-        return pd.DataFrame(data, columns=['Tag', 'Value'])
+        tags, values = [], []
+        for elem in Root.iter():
+            tags.append(elem.tag)
+            values.append(elem.text)
+        return pd.DataFrame({'Tag': tags, 'Value': values})
 
     return Root_to_DataFrame
 
 
-def Period_to_DataFrame_fn(get_Period_data: Callable) -> Callable:
-    def Period_to_DataFrame(Period: etree._Element) -> pd.DataFrame:
-        """
-        Periods are implicitly valid as index is constructed independent from data extraction.
-        Errors would occur at DataFrame construction.
-        """
-        index = get_Period_index(Period)
-        data = get_Period_data(Period, length=len(index))
-        assert len(data) == len(index)
-        df = pd.DataFrame(data=data, index=index)
+def _Period_to_DataFrame(Period: etree._Element, get_Period_data: Callable) -> pd.DataFrame:
+    """
+    Periods are implicitly valid as index is constructed independent from data extraction.
+    Errors would occur at DataFrame construction.
+    """
+    index = get_Period_index(Period)
+    data = get_Period_data(Period, length=len(index))
+    df = pd.DataFrame(data=data, index=index)
 
-        metadata_nodes: list = Period.xpath(
-            f"./*[not(self::Point)]", namespaces=Period.nsmap
-        )
-        metadata: dict = {Period.tag: dict(map(unfold_node, metadata_nodes))}
-        meta_dict = pd.json_normalize(metadata).iloc[0].to_dict()
-        df = df.assign(**meta_dict)
+    metadata_nodes: list = _XP_NONPOINT(Period)
+    metadata: dict = {Period.tag: dict(map(unfold_node, metadata_nodes))}
+    meta_dict = _flatten(metadata)
+    df = assign_metadata(df, meta_dict)
+
+    return df
 
-        return df
 
-    return Period_to_DataFrame
+def Period_to_DataFrame_fn(get_Period_data: Callable) -> Callable:
+    # A partial rather than a closure, so Period parsers can be shipped to worker processes.
+    return partial(_Period_to_DataFrame, get_Period_data=get_Period_data)
 
 
 def get_Period_index(Period: etree._Element) -> pd.Index:
-    start = Period.timeInterval.start.text
-    end = Period.timeInterval.end.text
-    resolution = Period.resolution.text
-    index = pd.date_range(start, end, freq=resolution_map[resolution])
-    index = index[:-1] if index.size > 1 else index
+    time_interval = Period.find("timeInterval")
+    start = time_interval.findtext("start")
+    end = time_interval.findtext("end")
+    resolution = Period.findtext("resolution")
+    step = _resolution_step_ns.get(resolution)
+    if step is None:
+        index = pd.date_range(start, end, freq=resolution_map[resolution])
+        index = index[:-1] if index.size > 1 else index
+        return index
+    # Fixed-length resolutions: lay out the (right-open) interval directly.
+    start, end = pd.Timestamp(start), pd.Timestamp(end)
+    periods = max((end.value - start.value) // step, 1)
+    index = pd.DatetimeIndex((start.value + np.arange(periods, dtype=np.int64) * step).astype("datetime64[ns]"))
+    if start.tz is not None:
+        index = index.tz_localize("UTC").tz_convert(start.tz)
     return index
 
 
@@ -117,48 +234,93 @@ resolution_map: Dict = {
     "PT1M": "1min",
 }
 
+# Nanosecond steps of the fixed-length resolutions; calendar based ones (months, years) are left to `pd.date_range`.
+_resolution_step_ns: Dict[str, int] = {
+    resolution: pd.Timedelta(freq).value
+    for resolution, freq in resolution_map.items()
+    if not freq.endswith("M")
+}
+
 
-def check_period_data_missing(data: list[Dict[str, str]],
-                              key: str) -> List[Dict]:
+def check_period_data_missing(data: Dict[str, np.ndarray],
+                              expected_length: int = 0) -> Dict[str, np.ndarray]:
     """
-    Checks for missing data in the data list (missing position from the api response)
+    Checks for missing data in the data columns (missing position from the api response).
+    A missing position repeats the values of the position preceding it.
+    Positions past the last reported one are padded the same way up to `expected_length`.
     """
-    data.sort(key=lambda x: int(x['position']))
-    complete_data = {int(pos['position']): pos[key] for pos in data}
-    for position in range(1, max(complete_data) + 1):
-        if position not in complete_data:
-            prev_position = max(filter(lambda x: x < position, complete_data), default=0)
-            data.append({'position': str(position), key: complete_data[prev_position]})
-    data.sort(key=lambda x: int(x['position']))
-    return data
+    positions = data['position']
+    length = max(positions.max(), expected_length)
+    # Common case: the api reports every position 1..n in order, nothing to fill.
+    if positions[0] == 1 and positions[-1] == len(positions) == length and (np.diff(positions) == 1).all():
+        return data
+    order = np.argsort(positions, kind='stable')
+    # For every position 1..length, the (sorted) row of the last reported point at or before it.
+    rows = np.full(length, -1, dtype=np.intp)
+    rows[positions[order] - 1] = np.arange(len(order))
+    rows = np.maximum.accumulate(rows).clip(min=0)
+    take = order[rows]
+    return {
+        'position': np.arange(1, len(rows) + 1, dtype=np.int32),
+        **{tag: values[take] for tag, values in data.items() if tag != 'position'},
+    }
+
+
+def _to_column(values) -> np.ndarray:
+    """Numeric Point fields become float64 arrays, anything else is kept as strings."""
+    try:
+        return np.asarray(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        return np.asarray(values, dtype=object)
+
+
+def get_Point_columns(Period: etree._Element) -> Dict[str, Any]:
+    """
+    Field texts of all `Point`s in a Period, column-wise.
+    Points usually share one layout, so the fast path only reads the field tags off the first Point.
+    """
+    first = next(Period.iterchildren(tag="Point"))
+    tags = [datum.tag for datum in first.iterchildren()]
+    # Fast path: libxml2 collects every field text in a single call, which is then reshaped into columns.
+    # Only valid if every Point holds exactly the first Point's fields, in the same order, and none is empty.
+    size = int(_XP_POINT_COUNT(Period)) * len(tags)
+    if _XP_POINT_FIELD_COUNT(Period) == size and _point_layout_xpath(tuple(tags))(Period) == size:
+        texts = _XP_POINT_FIELDS(Period)
+        if len(texts) == size:
+            return dict(zip(tags, np.array(texts).reshape(-1, len(tags)).T))
+    # Slow path: empty or differing fields, one dict per Point; fields a Point lacks are filled with None.
+    rows = [
+        {datum.tag: datum.text for datum in point.iterchildren()}
+        for point in Period.iterchildren(tag="Point")
+    ]
+    all_tags = dict.fromkeys(tag for row in rows for tag in row)
+    return {tag: [row.get(tag) for row in rows] for tag in all_tags}
 
 
 def get_Period_data(Period: etree._Element,
-                    length: int) -> List[Dict]:
-    points = Period.xpath("./Point", namespaces=Period.nsmap)
-    data = [
-        dict([(datum.tag, datum.text) for datum in point.iterchildren()])
-        for point in points
-    ]
-    key = list(data[0].keys())[1]
-    data = check_period_data_missing(data=data,
-                                     key=key)
-    # check for missing positions if the length of the index is longer that the data (and no position is missing
-    # inside the data list)
-    if length != len(data):
-        data += [{'position': str(i + 1), key: data[-1][key]} for i in range(length - len(data))]
-    return data
+                    length: int) -> Dict[str, np.ndarray]:
+    columns = get_Point_columns(Period)
+    # Hand the Points over column-wise, so the DataFrame is built from typed arrays.
+    data = {
+        'position': np.asarray(columns.pop('position'), dtype=np.int32),
+        **{tag: _to_column(values) for tag, values in columns.items()},
+    }
+    return check_period_data_missing(data=data, expected_length=length)
 
 
-def get_Period_Financial_Price_data(Period: etree._Element) -> List[Dict]:
+def get_Period_Financial_Price_data(Period: etree._Element, length: int = 0) -> List[Dict]:
     """
     TODO: Could be abstracted into `get_Period_data.
+    `length` keeps the signature of `get_Period_data`; rows are not padded to it.
     """
-    points = Period.xpath("./Point", namespaces=Period.nsmap)
+    points = _XP_POINT(Period)
     data = [get_Point_Financial_Price_data(point) for point in points]
     return data
 
 
+_DIRECTION_MAP = {"A01": "up", "A02": "down", "A03": "up_and_down"}
+
+
 def get_Point_Financial_Price_data(Point: etree._Element) -> Dict:
     """
     If a `Point` has overlapping `Financial_Price` field,
@@ -166,43 +328,62 @@ def get_Point_Financial_Price_data(Point: etree._Element) -> Dict:
 
     Applicable at e.g. FinancialExpensesAndIncomeForBalancing
     """
-    direction_map = {"A01": "up", "A02": "down", "A03": "up_and_down"}
-
-    datum = {Point.position.tag: Point.position.text}
-    for fp in Point.Financial_Price:
-        datum[
-            ".".join([fp.tag, direction_map[fp.direction.text], fp.amount.tag])
-        ] = fp.amount.text
+    position = Point.find("position")
+    datum = {position.tag: position.text}
+    for fp in Point.iterchildren("Financial_Price"):
+        amount = fp.find("amount")
+        # Interned, so every Point shares the same column-name objects.
+        key = sys.intern(f"{fp.tag}.{_DIRECTION_MAP[fp.findtext('direction')]}.{amount.tag}")
+        datum[key] = amount.text
 
     return datum
 
 
-def get_index(Period: etree._Element) -> pd.Index:
+def collect_outage_nodes(Period: etree._Element) -> Dict[str, List[etree._Element]]:
+    """
+    Single walk over an outage document and its TimeSeries, grouping the nodes read by the outage helpers by tag.
+    Children of a TimeSeries are keyed by their path, e.g. `TimeSeries/Available_Period`.
+    """
+    nodes: Dict[str, List[etree._Element]] = {}
+    for child in Period.iterchildren():
+        nodes.setdefault(child.tag, []).append(child)
+        if child.tag == "TimeSeries":
+            for grandchild in child.iterchildren():
+                nodes.setdefault(f"TimeSeries/{grandchild.tag}", []).append(grandchild)
+    return nodes
+
+
+def get_index(Period: etree._Element,
+              nodes: Dict[str, List[etree._Element]] = None) -> pd.Index:
     """
     Get index of the series
     """
-    points = Period.xpath("unavailability_Time_Period.timeInterval")
-    data = [
-        dict([(datum.tag, datum.text) for datum in point.iterchildren()])
-        for point in points
-    ][0]
-    start = data['start']
-    end = data['end']
-    resolution = Period.xpath("./TimeSeries/Available_Period/resolution")
-    if not resolution:
+    nodes = nodes if nodes is not None else collect_outage_nodes(Period)
+    time_interval = nodes['unavailability_Time_Period.timeInterval'][0]
+    start = time_interval.findtext('start')
+    end = time_interval.findtext('end')
+    available_periods = nodes.get('TimeSeries/Available_Period', [])
+    resolution = available_periods[0].findtext('resolution') if available_periods else None
+    if resolution is None:
         index = [pd.to_datetime(datetime.datetime.now().replace(minute=0, second=0, microsecond=0), )]
     else:
-        index = pd.date_range(start, end, freq=resolution_map[resolution[0]])
+        index = pd.date_range(start, end, freq=resolution_map[resolution])
         index = index[:-1] if index.size > 1 else index
     return index
 
 
-def get_data(Period: etree._Element) -> tuple[pd.DatetimeIndex, list[dict[Any, Any]]]:
+def get_data(Period: etree._Element,
+             nodes: Dict[str, List[etree._Element]] = None) -> tuple[pd.DatetimeIndex, list[dict[Any, Any]]]:
     """
     Get the data of the series
     """
-    index = get_index(Period=Period)
-    points = Period.xpath("./TimeSeries/Available_Period/Point")
+    nodes = nodes if nodes is not None else collect_outage_nodes(Period)
+    index = get_index(Period=Period, nodes=nodes)
+    points = [
+        point
+        for available_period in nodes.get('TimeSeries/Available_Period', [])
+        for point in available_period.iterchildren(tag='Point')
+    ]
     data = [
         dict([(datum.tag, datum.text) for datum in point.iterchildren()])
         for point in points
@@ -212,61 +393,52 @@ def get_data(Period: etree._Element) -> tuple[pd.DatetimeIndex, list[dict[Any, A
                 'quantity': 0}]
         return index, data
     else:
-        new_ind = []
-        for elem in data:
-            new_ind.append(index[int(elem['position']) - 1])
-        new_ind = pd.DatetimeIndex(new_ind)
+        positions = np.array([elem['position'] for elem in data]).astype(np.int32)
+        new_ind = pd.DatetimeIndex(index)[positions - 1]
         return new_ind, data
 
 
-def get_resource(Period: etree._Element) -> Dict:
+def get_resource(Period: etree._Element,
+                 nodes: Dict[str, List[etree._Element]] = None) -> Dict:
     """
     Handle the case when there are multiple affected assets
     :param Period:
+    :param nodes: `collect_outage_nodes` of the Period, if already at hand.
     :return:
     """
-    tag_available = Period.find("./TimeSeries/Asset_RegisteredResource")
-    if tag_available is not None:
-        points = Period.xpath("./TimeSeries/Asset_RegisteredResource")
-        data = [
-            dict([(f"Asset_RegisteredResource.{datum.tag}", datum.text) for datum in point.iterchildren()])
-            for point in points
-        ]
-        if len(data) == 0:
-            data = [{'Asset_RegisteredResource.mRID': '',
-                     'Asset_RegisteredResource.name': '',
-                     'Asset_RegisteredResource.asset_PSRType.psrType': '',
-                     'Asset_RegisteredResource.location.name': ''
-                     }]
-        if all(isinstance(entry, dict) for entry in data):
-            result = {}
-            for entry in data:
-                for key, value in entry.items():
-                    result.setdefault(key, []).append(value)
-            result = {key: ', '.join(values) for key, values in result.items()}
-        return result
-
-
-def get_infos(Period: etree._Element) -> Dict:
+    nodes = nodes if nodes is not None else collect_outage_nodes(Period)
+    resources = nodes.get('TimeSeries/Asset_RegisteredResource')
+    if not resources:
+        return None
+    result = defaultdict(list)
+    for resource in resources:
+        for datum in resource.iterchildren():
+            result[f"Asset_RegisteredResource.{datum.tag}"].append(datum.text)
+    return {key: ', '.join(values) for key, values in result.items()}
+
+
+def get_infos(Period: etree._Element,
+              nodes: Dict[str, List[etree._Element]] = None) -> Dict:
     """
     Get additional infos of the document for the series
     """
-    points = Period.xpath("//TimeSeries", namespaces=Period.nsmap)
-    data = [
-        dict([(f"TimeSeries.{datum.tag}", datum.text) for datum in point.iterchildren()])
-        for point in points
-    ][0]
-    data.pop('TimeSeries.Asset_RegisteredResource', None)
-    data.pop('TimeSeries.Available_Period', None)
-    data.pop('TimeSeries.Reason', None)
+    nodes = nodes if nodes is not None else collect_outage_nodes(Period)
+    time_series = nodes['TimeSeries'][0]
+    data = {
+        f"TimeSeries.{datum.tag}": datum.text
+        for datum in time_series.iterchildren()
+        if datum.tag not in ('Asset_RegisteredResource', 'Available_Period', 'Reason')
+    }
     return data
 
 
-def get_reason(Period: etree._Element) -> Dict:
+def get_reason(Period: etree._Element,
+               nodes: Dict[str, List[etree._Element]] = None) -> Dict:
     """
     Get the reason for the outage
     """
-    points = Period.xpath("./Reason", namespaces=Period.nsmap)
+    nodes = nodes if nodes is not None else collect_outage_nodes(Period)
+    points = nodes.get('Reason', [])
     data = [
         dict([(f"Reason.{datum.tag}", datum.text) for datum in point.iterchildren()])
         for point in points
@@ -279,17 +451,20 @@ def get_reason(Period: etree._Element) -> Dict:
     return data
 
 
-def get_createdatetime(Period: etree._Element) -> Dict:
+def get_createdatetime(Period: etree._Element,
+                       nodes: Dict[str, List[etree._Element]] = None) -> Dict:
     """
     Get the creation Date Time
     """
-    created = Period.xpath("./createdDateTime", namespaces=Period.nsmap)
-    docstat = Period.xpath("./docStatus/value", namespaces=Period.nsmap)
-    revision = Period.xpath("./revisionNumber", namespaces=Period.nsmap)
-    resolution = Period.xpath("//TimeSeries/Available_Period/resolution", namespaces=Period.nsmap)
-    data = {'CreatedDateTime': str(created[0]) if len(created) == 1 else None,
-            'DocStatus': str(docstat[0]) if len(docstat) == 1 else None,
-            'RevisionNumber': str(revision[0]) if len(revision) == 1 else None,
+    nodes = nodes if nodes is not None else collect_outage_nodes(Period)
+    resolution = [
+        resolution.text
+        for available_period in nodes.get('TimeSeries/Available_Period', [])
+        for resolution in available_period.iterchildren(tag='resolution')
+    ]
+    data = {'CreatedDateTime': Period.findtext('createdDateTime'),
+            'DocStatus': Period.findtext('docStatus/value'),
+            'RevisionNumber': Period.findtext('revisionNumber'),
             'Resolution': str(resolution_map[resolution[0]]) if len(resolution) == 1 else None}
     return data
 
@@ -299,17 +474,16 @@ def outage_transmission() -> Callable:
         """
         Build the dataframe from the series
         """
-        index, data = get_data(Period=Period)
+        # One walk over the document, shared by the helpers below instead of each running its own lookups.
+        nodes = collect_outage_nodes(Period)
+        index, data = get_data(Period=Period, nodes=nodes)
         assert len(data) == len(index)
         df = pd.DataFrame(data=data, index=index)
-        resource = get_resource(Period=Period)
-        infos = get_infos(Period=Period)
-        reason = get_reason(Period=Period)
-        created = get_createdatetime(Period=Period)
-        if resource is not None:
-            final = df.assign(**{**resource, **infos, **reason, **created})
-        else:
-            final = df.assign(**{**infos, **reason, **created})
+        resource = get_resource(Period=Period, nodes=nodes)
+        infos = get_infos(Period=Period, nodes=nodes)
+        reason = get_reason(Period=Period, nodes=nodes)
+        created = get_createdatetime(Period=Period, nodes=nodes)
+        final = assign_metadata(df, {**(resource or {}), **infos, **reason, **created})
         return final
     return outage_dataframe
 
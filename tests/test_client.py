@@ -1,6 +1,7 @@
 import unittest
 import os
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
@@ -127,6 +128,159 @@ class ParserTest(unittest.TestCase):
         self.assertEqual(len(df), 3)
         self.assertEqual(df.columns[1], 'price.amount')
 
+    def test_period_data_dtypes(self):
+        mock_period = XMLParser.deserialize_xml(self.mock_period_faulty)
+        data = ParserUtils.get_Period_data(mock_period, length=2)
+        self.assertEqual(data['position'].dtype, 'int32')
+        self.assertEqual(data['quantity'].dtype, 'float64')
+        self.assertEqual(data['quantity'].tolist(), [11.0, 11.0])
+
+    def test_period_data_extra_field(self):
+        mock_period = XMLParser.deserialize_xml(
+            b'<Period><Point><position>1</position><quantity>11</quantity></Point>'
+            b'<Point><position>2</position><quantity>12</quantity><secondaryQuantity>3</secondaryQuantity></Point></Period>'
+        )
+        data = ParserUtils.get_Period_data(mock_period, length=2)
+        self.assertEqual(data['quantity'].tolist(), [11.0, 12.0])
+        self.assertTrue(np.isnan(data['secondaryQuantity'][0]))
+        self.assertEqual(data['secondaryQuantity'][1], 3.0)
+
+    def test_period_data_extra_field_first(self):
+        mock_period = XMLParser.deserialize_xml(
+            b'<Period><Point><position>1</position><quantity>11</quantity><secondaryQuantity>3</secondaryQuantity></Point>'
+            b'<Point><position>2</position><quantity>12</quantity></Point></Period>'
+        )
+        data = ParserUtils.get_Period_data(mock_period, length=2)
+        self.assertEqual(data['quantity'].tolist(), [11.0, 12.0])
+        self.assertEqual(data['secondaryQuantity'][0], 3.0)
+        self.assertTrue(np.isnan(data['secondaryQuantity'][1]))
+
+    def test_point_columns_empty_field(self):
+        mock_period = XMLParser.deserialize_xml(
+            b'<Period><Point><position>1</position><quantity>11</quantity></Point>'
+            b'<Point><position>2</position><quantity/></Point></Period>'
+        )
+        columns = ParserUtils.get_Point_columns(mock_period)
+        self.assertEqual(list(columns['position']), ['1', '2'])
+        self.assertEqual(list(columns['quantity']), ['11', None])
+
+    def test_point_columns_shifted_layout(self):
+        mock_period = XMLParser.deserialize_xml(
+            b'<Period><Point><position>1</position><quantity>a</quantity><sec>1</sec></Point>'
+            b'<Point><position>2</position><sec>3</sec></Point>'
+            b'<Point><position>3</position><quantity>c</quantity><sec>5</sec><extra>x</extra></Point></Period>'
+        )
+        columns = ParserUtils.get_Point_columns(mock_period)
+        self.assertEqual(list(columns['quantity']), ['a', None, 'c'])
+        self.assertEqual(list(columns['sec']), ['1', '3', '5'])
+        self.assertEqual(list(columns['extra']), [None, None, 'x'])
+
+    def test_metadata_categorical(self):
+        timeseries = b''.join(
+            b'<TimeSeries><mRID>%d</mRID><Period><timeInterval><start>2018-03-01T00:00Z</start>'
+            b'<end>2018-03-01T02:00Z</end></timeInterval><resolution>PT60M</resolution>'
+            b'<Point><position>1</position><quantity>1</quantity></Point>'
+            b'<Point><position>2</position><quantity>2</quantity></Point></Period></TimeSeries>' % i
+            for i in range(2)
+        )
+        document = b'<GL_MarketDocument><mRID>x</mRID><type>A65</type>' + timeseries + b'</GL_MarketDocument>'
+        df = XMLParser().parse(document)
+        for column in ['Period.resolution', 'TimeSeries.mRID', 'GL_MarketDocument.type']:
+            self.assertIsInstance(df[column].dtype, pd.CategoricalDtype)
+        self.assertEqual(df['TimeSeries.mRID'].tolist(), ['0', '0', '1', '1'])
+        self.assertEqual(df['quantity'].dtype, 'float64')
+
+    def test_check_period_data_missing(self):
+        data = {
+            'position': np.array([4, 1, 2], dtype=np.int32),
+            'quantity': np.array([40.0, 10.0, 20.0]),
+        }
+        data = ParserUtils.check_period_data_missing(data)
+        self.assertEqual(data['position'].tolist(), [1, 2, 3, 4])
+        self.assertEqual(data['quantity'].tolist(), [10.0, 20.0, 20.0, 40.0])
+
+    def test_check_period_data_padding(self):
+        data = {
+            'position': np.array([1, 3], dtype=np.int32),
+            'quantity': np.array([10.0, 30.0]),
+        }
+        data = ParserUtils.check_period_data_missing(data, expected_length=5)
+        self.assertEqual(data['position'].tolist(), [1, 2, 3, 4, 5])
+        self.assertEqual(data['quantity'].tolist(), [10.0, 10.0, 30.0, 30.0, 30.0])
+
+    def test_check_period_data_dense(self):
+        data = {
+            'position': np.array([1, 2, 3], dtype=np.int32),
+            'quantity': np.array([10.0, 20.0, 30.0]),
+        }
+        self.assertIs(ParserUtils.check_period_data_missing(data), data)
+
+    def test_outage_document(self):
+        document = (
+            b'<Unavailability_MarketDocument xmlns="urn:iec62325.351:tc57wg16:451-6:outagedocument:3:0">'
+            b'<mRID>doc</mRID><revisionNumber>2</revisionNumber><type>A80</type>'
+            b'<createdDateTime>2021-08-20T10:00:00Z</createdDateTime>'
+            b'<unavailability_Time_Period.timeInterval><start>2021-08-24T00:00Z</start><end>2021-08-24T04:00Z</end>'
+            b'</unavailability_Time_Period.timeInterval>'
+            b'<docStatus><value>A05</value></docStatus>'
+            b'<TimeSeries><mRID>1</mRID><businessType>A53</businessType>'
+            b'<Asset_RegisteredResource><mRID>R1</mRID><name>Line 1</name></Asset_RegisteredResource>'
+            b'<Asset_RegisteredResource><mRID>R2</mRID><name>Line 2</name></Asset_RegisteredResource>'
+            b'<Available_Period><timeInterval><start>2021-08-24T00:00Z</start><end>2021-08-24T04:00Z</end>'
+            b'</timeInterval><resolution>PT60M</resolution>'
+            b'<Point><position>1</position><quantity>100</quantity></Point>'
+            b'<Point><position>3</position><quantity>300</quantity></Point>'
+            b'</Available_Period></TimeSeries>'
+            b'<Reason><code>B18</code><text>Maintenance</text></Reason>'
+            b'</Unavailability_MarketDocument>'
+        )
+        df = XMLParser().parse(document)
+        self.assertEqual(
+            list(df.columns),
+            ['position', 'quantity', 'Asset_RegisteredResource.mRID', 'Asset_RegisteredResource.name',
+             'TimeSeries.mRID', 'TimeSeries.businessType', 'Reason.code', 'Reason.text',
+             'CreatedDateTime', 'DocStatus', 'RevisionNumber', 'Resolution']
+        )
+        self.assertEqual(
+            list(df.index),
+            [pd.Timestamp('2021-08-24T00:00Z'), pd.Timestamp('2021-08-24T02:00Z')]
+        )
+        self.assertEqual(df['quantity'].tolist(), ['100', '300'])
+        self.assertEqual(df['Asset_RegisteredResource.mRID'].tolist(), ['R1, R2'] * 2)
+        self.assertEqual(df['Asset_RegisteredResource.name'].tolist(), ['Line 1, Line 2'] * 2)
+        self.assertEqual(df['Reason.text'].tolist(), ['Maintenance'] * 2)
+        self.assertEqual(df['DocStatus'].tolist(), ['A05'] * 2)
+        self.assertEqual(df['RevisionNumber'].tolist(), ['2'] * 2)
+
+    def test_parse_parallel(self):
+        timeseries = b''.join(
+            b'<TimeSeries><mRID>%d</mRID><Period><timeInterval><start>2018-03-01T00:00Z</start>'
+            b'<end>2018-03-01T02:00Z</end></timeInterval><resolution>PT60M</resolution>'
+            b'<Point><position>1</position><quantity>%d</quantity></Point>'
+            b'<Point><position>2</position><quantity>%d</quantity></Point></Period></TimeSeries>' % (i, i, i + 1)
+            for i in range(3)
+        )
+        document = b'<GL_MarketDocument><mRID>x</mRID><type>A65</type>' + timeseries + b'</GL_MarketDocument>'
+        sequential = XMLParser().parse(document)
+        parallel = XMLParser(max_workers=2).parse(document)
+        pd.testing.assert_frame_equal(parallel, sequential)
+        self.assertEqual(parallel['quantity'].tolist(), [0.0, 1.0, 1.0, 2.0, 2.0, 3.0])
+
+    def test_financial_price_period(self):
+        mock_period = XMLParser.deserialize_xml(
+            b'<Period><timeInterval><start>2021-08-23T22:00Z</start><end>2021-08-24T22:00Z</end></timeInterval>'
+            b'<resolution>P1D</resolution><Point><position>1</position>'
+            b'<Financial_Price><amount>10.5</amount><direction>A01</direction></Financial_Price>'
+            b'<Financial_Price><amount>-3</amount><direction>A02</direction></Financial_Price>'
+            b'</Point></Period>'
+        )
+        period_to_dataframe = ParserUtils.Period_to_DataFrame_fn(
+            ParserUtils.get_Period_Financial_Price_data
+        )
+        df = period_to_dataframe(mock_period)
+        self.assertEqual(df['Financial_Price.up.amount'].tolist(), ['10.5'])
+        self.assertEqual(df['Financial_Price.down.amount'].tolist(), ['-3'])
+
 
 class IntegrationTest(unittest.TestCase):
     @classmethod